@@ -0,0 +1,114 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artist_cache (
+    query TEXT NOT NULL,
+    market TEXT NOT NULL,
+    search_limit INTEGER NOT NULL,
+    artist_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (query, market, search_limit)
+);
+CREATE TABLE IF NOT EXISTS tracks_cache (
+    artist_id TEXT NOT NULL,
+    market TEXT NOT NULL,
+    track_limit INTEGER NOT NULL,
+    uris TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (artist_id, market, track_limit)
+);
+CREATE TABLE IF NOT EXISTS playlist_cache (
+    playlist_id TEXT PRIMARY KEY,
+    snapshot_id TEXT NOT NULL,
+    uris_digest TEXT NOT NULL
+);
+"""
+
+
+class ApiCache:
+    def __init__(self, path: Path, ttl_seconds: float, read_only: bool = False):
+        self.ttl_seconds = ttl_seconds
+        self.read_only = read_only
+        # Lookups run on the resolution thread pool, so share one connection behind a lock.
+        self._lock = threading.Lock()
+        if read_only:
+            self._conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+
+    def get_artist(self, query: str, market: str, search_limit: int) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT artist_id, name, url FROM artist_cache"
+                " WHERE query = ? AND market = ? AND search_limit = ? AND expires_at > ?",
+                (query, market, search_limit, time.time()),
+            ).fetchone()
+        if not row:
+            return None
+        artist_id, name, url = row
+        return {"id": artist_id, "name": name, "external_urls": {"spotify": url}}
+
+    def set_artist(self, query: str, market: str, search_limit: int, artist: dict):
+        if self.read_only:
+            return
+        url = artist.get("external_urls", {}).get("spotify", "")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artist_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (query, market, search_limit, artist["id"], artist.get("name", ""), url, self._expires_at()),
+            )
+
+    def get_tracks(self, artist_id: str, market: str, track_limit: int) -> list[str] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT uris FROM tracks_cache"
+                " WHERE artist_id = ? AND market = ? AND track_limit = ? AND expires_at > ?",
+                (artist_id, market, track_limit, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_tracks(self, artist_id: str, market: str, track_limit: int, uris: list[str]):
+        if self.read_only:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tracks_cache VALUES (?, ?, ?, ?, ?)",
+                (artist_id, market, track_limit, json.dumps(uris), self._expires_at()),
+            )
+
+    # Playlist state has no TTL: a snapshot ID stays valid until the playlist changes.
+    def get_playlist_state(self, playlist_id: str) -> tuple[str, str] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot_id, uris_digest FROM playlist_cache WHERE playlist_id = ?",
+                (playlist_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set_playlist_state(self, playlist_id: str, snapshot_id: str, uris_digest: str):
+        if self.read_only:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlist_cache VALUES (?, ?, ?)",
+                (playlist_id, snapshot_id, uris_digest),
+            )
+
+    def clear(self):
+        if self.read_only:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM artist_cache")
+            self._conn.execute("DELETE FROM tracks_cache")
+            self._conn.execute("DELETE FROM playlist_cache")
+
+    def _expires_at(self) -> float:
+        return time.time() + self.ttl_seconds
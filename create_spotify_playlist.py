@@ -1,17 +1,39 @@
 import base64
+import hashlib
 import os
 import random
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 
+import orjson
 import spotipy
 from dotenv import load_dotenv
+from requests import Response, Session
+from requests.adapters import HTTPAdapter, Retry
 from spotipy.oauth2 import SpotifyPKCE
 
+from cache import ApiCache
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 ENV_FILE = SCRIPT_DIR / ".env"
 
+TITLE_PATTERN = re.compile(r"^\s*#\s+(.+?)\s*$")
+BAND_LINE_PATTERN = re.compile(r"^\s*-\s+(.+?)\s*$")
+BAND_LINE_PREFIX_PATTERN = re.compile(r"^(\s*-\s+)(.+?)\s*$")
+BAND_ENTRY_PATTERN = re.compile(r"^(.+?)\s*\((\d+)\)\s*$")
+SPOTIFY_LINK_PATTERN = re.compile(r"\s*\[spotify\]\(https://open\.spotify\.com/artist/([a-zA-Z0-9]+)\)")
+ARTIST_ID_PATTERN = re.compile(r"^[0-9A-Za-z]{22}$")
+PLAYLIST_LINK_PATTERN = re.compile(r"^\[.*\]\(https://open\.spotify\.com/playlist/\w+\)$")
+SCOPES_SEPARATOR_PATTERN = re.compile(r"[\s,]+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+DASH_PATTERN = re.compile(r"\s*-\s*")
+PLAYLIST_NAME_CHAR_TABLE = str.maketrans({"–": "-", "—": "-", "−": "-", "’": "'"})
+
 
 def require_env(name: str) -> str:
     value = os.getenv(name, "").strip()
@@ -38,18 +60,17 @@ def bool_env(name: str, default: str) -> bool:
 
 
 def parse_scopes(value: str) -> str:
-    parts = [part.strip() for part in re.split(r"[\s,]+", value) if part.strip()]
+    parts = [part.strip() for part in SCOPES_SEPARATOR_PATTERN.split(value) if part.strip()]
     if not parts:
         raise SystemExit("SPOTIFY_SCOPES must not be empty.")
     return " ".join(parts)
 
 
+@lru_cache(maxsize=4096)
 def normalize_playlist_name(name: str) -> str:
-    normalized = name.lower()
-    normalized = normalized.replace("–", "-").replace("—", "-").replace("−", "-")
-    normalized = normalized.replace("’", "'")
-    normalized = re.sub(r"\s+", " ", normalized)
-    normalized = re.sub(r"\s*-\s*", " - ", normalized)
+    normalized = name.lower().translate(PLAYLIST_NAME_CHAR_TABLE)
+    normalized = WHITESPACE_PATTERN.sub(" ", normalized)
+    normalized = DASH_PATTERN.sub(" - ", normalized)
     return normalized.strip()
 
 
@@ -60,106 +81,119 @@ def resolve_path(path_value: str) -> Path:
     return SCRIPT_DIR / path
 
 
-def strip_status_hints(name: str, not_found_hint: str, skipped_hint: str) -> str:
-    for hint in (not_found_hint, skipped_hint):
-        if hint and name.endswith(f" {hint}"):
-            return name[: -len(hint) - 1].rstrip()
-        if hint and name.endswith(hint):
+def status_hint_suffixes(not_found_hint: str, skipped_hint: str) -> tuple[str, ...]:
+    return tuple(hint for hint in (not_found_hint, skipped_hint) if hint)
+
+
+def strip_status_hints(name: str, hints: tuple[str, ...]) -> str:
+    # A separating space is removed by the rstrip(), so matching the bare hint is enough.
+    if not name.endswith(hints):
+        return name
+    for hint in hints:
+        if name.endswith(hint):
             return name[: -len(hint)].rstrip()
     return name
 
 
 def strip_spotify_link(name: str) -> str:
-    return re.sub(r"\s*\[spotify\]\(https://open\.spotify\.com/artist/[a-zA-Z0-9]+\)", "", name).rstrip()
+    return SPOTIFY_LINK_PATTERN.sub("", name).rstrip()
 
 
 def format_hint(hint: str) -> str:
     return f" {hint.lstrip()}" if hint else ""
 
 
-def derive_playlist_name(markdown_path: Path) -> str:
-    title = ""
-    for line in markdown_path.read_text(encoding="utf-8").splitlines():
-        match = re.match(r"^\s*#\s+(.+?)\s*$", line)
-        if match:
-            title = match.group(1).strip()
-            break
+@dataclass
+class BandsDocument:
+    title: str = ""
+    bands: list[str] = field(default_factory=list)
+    skipped: set[str] = field(default_factory=set)
+    track_overrides: dict[str, int] = field(default_factory=dict)
+    artist_ids: dict[str, str] = field(default_factory=dict)
 
-    if not title:
-        return f"{markdown_path.stem} - Top 5 je Band"
 
-    return f"{title} - Top 5 je Band"
+def derive_playlist_name(title: str, default_title: str) -> str:
+    return f"{title or default_title} - Top 5 je Band"
 
 
 def parse_band_entry(name: str) -> tuple[str, int | None]:
-    match = re.match(r"^(.+?)\s*\((\d+)\)\s*$", name)
+    match = BAND_ENTRY_PATTERN.match(name)
     if match:
         return match.group(1).rstrip(), int(match.group(2))
     return name, None
 
 
-def load_bands(
-    markdown_path: Path, not_found_hint: str, skipped_hint: str
-) -> tuple[list[str], set[str], dict[str, int]]:
-    bands: list[str] = []
-    intentionally_skipped_from_file: set[str] = set()
-    track_overrides: dict[str, int] = {}
-    for line in markdown_path.read_text(encoding="utf-8").splitlines():
-        match = re.match(r"^\s*-\s+(.+?)\s*$", line)
+def parse_bands_document(lines: list[str], not_found_hint: str, skipped_hint: str) -> BandsDocument:
+    # Single pass: the first "#" heading is the title, "-" lines are bands.
+    document = BandsDocument()
+    status_hints = status_hint_suffixes(not_found_hint, skipped_hint)
+    for line in lines:
+        if not document.title:
+            title_match = TITLE_PATTERN.match(line)
+            if title_match:
+                document.title = title_match.group(1).strip()
+                continue
+
+        match = BAND_LINE_PATTERN.match(line)
         if match:
             raw_name = match.group(1)
-            base_name = strip_status_hints(raw_name, not_found_hint, skipped_hint)
+            base_name = strip_status_hints(raw_name, status_hints)
+            link_match = SPOTIFY_LINK_PATTERN.search(base_name)
             base_name = strip_spotify_link(base_name)
             base_name, override = parse_band_entry(base_name)
-            bands.append(base_name)
+            document.bands.append(base_name)
             if override is not None:
-                track_overrides[base_name] = override
+                document.track_overrides[base_name] = override
+            if link_match:
+                document.artist_ids[base_name] = link_match.group(1)
             if skipped_hint and raw_name.endswith(skipped_hint):
-                intentionally_skipped_from_file.add(base_name)
-    return bands, intentionally_skipped_from_file, track_overrides
+                document.skipped.add(base_name)
+    return document
 
 
 def update_bands_hints(
-    markdown_path: Path,
+    lines: list[str],
     not_found_exact: set[str],
     intentionally_skipped: set[str],
     not_found_hint: str,
     skipped_hint: str,
     artist_urls: dict[str, str] | None = None,
-):
+) -> list[str]:
     updated_lines: list[str] = []
     not_found_hint_text = format_hint(not_found_hint)
     skipped_hint_text = format_hint(skipped_hint)
     urls = artist_urls or {}
+    status_hints = status_hint_suffixes(not_found_hint, skipped_hint)
 
-    for line in markdown_path.read_text(encoding="utf-8").splitlines():
-        match = re.match(r"^(\s*-\s+)(.+?)\s*$", line)
+    for line in lines:
+        match = BAND_LINE_PREFIX_PATTERN.match(line)
         if not match:
             updated_lines.append(line)
             continue
 
         prefix, raw_name = match.groups()
-        base_name = strip_status_hints(raw_name, not_found_hint, skipped_hint)
+        base_name = strip_status_hints(raw_name, status_hints)
         base_name = strip_spotify_link(base_name)
+        base_name, override = parse_band_entry(base_name)
+        entry = f"{base_name} ({override})" if override is not None else base_name
         if base_name in intentionally_skipped:
-            updated_lines.append(f"{prefix}{base_name}{skipped_hint_text}")
+            updated_lines.append(f"{prefix}{entry}{skipped_hint_text}")
         elif base_name in not_found_exact:
-            updated_lines.append(f"{prefix}{base_name}{not_found_hint_text}")
+            updated_lines.append(f"{prefix}{entry}{not_found_hint_text}")
         else:
             link = f" [spotify]({urls[base_name]})" if base_name in urls else ""
-            updated_lines.append(f"{prefix}{base_name}{link}")
+            updated_lines.append(f"{prefix}{entry}{link}")
 
-    markdown_path.write_text("\n".join(updated_lines) + "\n", encoding="utf-8")
+    return updated_lines
 
 
-def append_playlist_url(markdown_path: Path, playlist_url: str):
-    playlist_link_pattern = re.compile(r"^\[.*\]\(https://open\.spotify\.com/playlist/\w+\)$")
-    lines = markdown_path.read_text(encoding="utf-8").splitlines()
+def append_playlist_url(lines: list[str], playlist_url: str) -> list[str]:
+    lines = list(lines)
 
     # Replace existing playlist link if present
     replaced = False
     for i, line in enumerate(lines):
-        if playlist_link_pattern.match(line.strip()):
+        if PLAYLIST_LINK_PATTERN.match(line.strip()):
             lines[i] = f"[Spotify Playlist]({playlist_url})"
             replaced = True
             break
@@ -168,7 +202,41 @@ def append_playlist_url(markdown_path: Path, playlist_url: str):
         lines.append("")
         lines.append(f"[Spotify Playlist]({playlist_url})")
 
-    markdown_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return lines
+
+
+def read_lines(markdown_path: Path) -> list[str]:
+    with markdown_path.open("r", encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f]
+
+
+def write_lines(markdown_path: Path, lines: list[str]):
+    with markdown_path.open("w", encoding="utf-8", newline="\n") as f:
+        f.writelines(f"{line}\n" for line in lines)
+
+
+def orjson_response_hook(response: Response, *args, **kwargs) -> Response:
+    # spotipy decodes responses via response.json(); orjson errors are ValueErrors as spotipy expects.
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def build_http_session(pool_size: int) -> Session:
+    # Same retry policy as spotipy's built-in session.
+    retry = Retry(
+        total=3,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=spotipy.Spotify.default_retry_codes,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=pool_size)
+    session = Session()
+    session.mount("https://", adapter)
+    session.hooks["response"].append(orjson_response_hook)
+    return session
 
 
 def normalize_artist_query(name: str, intentionally_skipped_bands: set[str]) -> str:
@@ -177,6 +245,14 @@ def normalize_artist_query(name: str, intentionally_skipped_bands: set[str]) ->
     return name
 
 
+def artist_summary(artist: dict) -> dict:
+    return {
+        "id": artist.get("id"),
+        "name": artist.get("name", ""),
+        "external_urls": {"spotify": artist.get("external_urls", {}).get("spotify", "")},
+    }
+
+
 def pick_best_artist(sp: spotipy.Spotify, query: str, market: str, search_limit: int):
     if not query:
         return None
@@ -188,112 +264,197 @@ def pick_best_artist(sp: spotipy.Spotify, query: str, market: str, search_limit:
     lowered_query = query.lower()
     for artist in items:
         if artist.get("name", "").lower() == lowered_query:
-            return artist
+            return artist_summary(artist)
     return None
 
 
 def top_tracks_for_artist(sp: spotipy.Spotify, artist_id: str, market: str, track_limit: int) -> list[str]:
     tracks = sp.artist_top_tracks(artist_id, country=market).get("tracks", [])
-    uris: list[str] = []
+    uris: dict[str, None] = {}
     for track in tracks:
         uri = track.get("uri")
-        if uri and uri not in uris:
-            uris.append(uri)
+        if uri:
+            uris[uri] = None
         if len(uris) >= track_limit:
             break
+    return list(uris)
+
+
+def fetch_artists_by_id(sp: spotipy.Spotify, artist_ids: list[str]) -> dict[str, dict]:
+    # Hand-edited or truncated links would make Spotify reject the whole batch, so only
+    # send well-formed IDs; anything not returned here falls back to a regular search.
+    valid_ids = [artist_id for artist_id in artist_ids if ARTIST_ID_PATTERN.match(artist_id)]
+    artists: dict[str, dict] = {}
+    for i in range(0, len(valid_ids), 50):
+        try:
+            result = sp.artists(valid_ids[i : i + 50])
+        except spotipy.SpotifyException as e:
+            print(f"Warning: Artist ID lookup failed, searching those bands instead: {e}")
+            continue
+        for artist in result.get("artists", []):
+            if artist and artist.get("id"):
+                artists[artist["id"]] = artist_summary(artist)
+    return artists
+
+
+def cached_pick_best_artist(
+    sp: spotipy.Spotify, cache: ApiCache | None, query: str, market: str, search_limit: int
+) -> dict | None:
+    artist = cache.get_artist(query, market, search_limit) if cache else None
+    if artist is None:
+        artist = pick_best_artist(sp, query, market, search_limit)
+        if artist and cache:
+            cache.set_artist(query, market, search_limit, artist)
+    return artist
+
+
+def cached_top_tracks_for_artist(
+    sp: spotipy.Spotify, cache: ApiCache | None, artist_id: str, market: str, track_limit: int
+) -> list[str]:
+    uris = cache.get_tracks(artist_id, market, track_limit) if cache else None
+    if uris is None:
+        uris = top_tracks_for_artist(sp, artist_id, market=market, track_limit=track_limit)
+        if uris and cache:
+            cache.set_tracks(artist_id, market, track_limit, uris)
     return uris
 
 
+def resolve_band(
+    sp: spotipy.Spotify,
+    cache: ApiCache | None,
+    query: str,
+    known_artist: dict | None,
+    market: str,
+    search_limit: int,
+    track_limit: int,
+) -> tuple[dict | None, list[str]]:
+    artist = known_artist or cached_pick_best_artist(sp, cache, query, market, search_limit)
+    if not artist:
+        return None, []
+    return artist, cached_top_tracks_for_artist(sp, cache, artist["id"], market, track_limit)
+
+
 def create_playlist(sp: spotipy.Spotify, user_id: str, name: str, description: str = "") -> str:
     playlist = sp.user_playlist_create(user=user_id, name=name, public=True, description=description)
     return playlist["id"]
 
 
-def delete_existing_playlists(sp: spotipy.Spotify, user_id: str, name: str) -> int:
-    deleted = 0
-    seen_playlist_ids: set[str] = set()
+def playlist_name_matches(name: str, normalized_target: str) -> bool:
+    # Normalization only collapses whitespace and pads dashes, so a name with a wildly
+    # different length cannot match; skip those before running the regex passes.
+    if len(name) < len(normalized_target) / 2 or len(name) > len(normalized_target) * 2:
+        return False
+    return normalize_playlist_name(name) == normalized_target
+
+
+def fetch_remaining_pages(
+    fetch_page: Callable[[int], dict], first_page: dict, page_size: int, concurrency: int
+) -> list[dict]:
+    # The first page reports the total, so the remaining offsets can be fetched in parallel.
+    items: list[dict] = []
+    offsets = range(page_size, first_page.get("total") or 0, page_size)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for page in pool.map(fetch_page, offsets):
+                items.extend(page.get("items", []))
+    return items
+
+
+def fetch_all_pages(fetch_page: Callable[[int], dict], page_size: int, concurrency: int) -> list[dict]:
+    first_page = fetch_page(0)
+    return first_page.get("items", []) + fetch_remaining_pages(fetch_page, first_page, page_size, concurrency)
+
+
+def fetch_user_playlists_page(sp: spotipy.Spotify, offset: int) -> dict:
+    return sp.current_user_playlists(limit=50, offset=offset)
+
+
+def delete_existing_playlists(sp: spotipy.Spotify, user_id: str, name: str, concurrency: int) -> int:
     normalized_target_name = normalize_playlist_name(name)
 
-    while True:
-        found_in_pass = False
-        offset = 0
-
-        while True:
-            page = sp.current_user_playlists(limit=50, offset=offset)
-            items = page.get("items", [])
-            if not items:
-                break
-
-            for playlist in items:
-                playlist_id = playlist.get("id")
-                playlist_name = playlist.get("name")
-                owner_id = playlist.get("owner", {}).get("id")
-                normalized = normalize_playlist_name(playlist_name or "")
-
-                if (
-                    playlist_id
-                    and normalized == normalized_target_name
-                    and owner_id == user_id
-                    and playlist_id not in seen_playlist_ids
-                ):
-                    sp.current_user_unfollow_playlist(playlist_id)
-                    seen_playlist_ids.add(playlist_id)
-                    deleted += 1
-                    found_in_pass = True
-
-            if len(items) < 50:
-                break
-            offset += 50
-
-        if not found_in_pass:
-            break
+    # Collect matches first: unfollowing while paging would shift later offsets.
+    matching_playlist_ids = list(
+        dict.fromkeys(
+            playlist["id"]
+            for playlist in fetch_all_pages(partial(fetch_user_playlists_page, sp), 50, concurrency)
+            if playlist.get("id")
+            and playlist.get("owner", {}).get("id") == user_id
+            and playlist_name_matches(playlist.get("name") or "", normalized_target_name)
+        )
+    )
 
-    return deleted
+    for playlist_id in matching_playlist_ids:
+        sp.current_user_unfollow_playlist(playlist_id)
+    return len(matching_playlist_ids)
 
 
-def find_existing_playlist(sp: spotipy.Spotify, user_id: str, name: str) -> dict | None:
+def find_existing_playlist(sp: spotipy.Spotify, user_id: str, name: str, concurrency: int) -> dict | None:
     normalized_target = normalize_playlist_name(name)
-    offset = 0
-    while True:
-        page = sp.current_user_playlists(limit=50, offset=offset)
-        items = page.get("items", [])
-        if not items:
-            return None
-        for playlist in items:
+
+    def first_match(playlists: list[dict]) -> dict | None:
+        for playlist in playlists:
             if (
                 playlist.get("owner", {}).get("id") == user_id
-                and normalize_playlist_name(playlist.get("name", "")) == normalized_target
+                and playlist_name_matches(playlist.get("name") or "", normalized_target)
             ):
                 return playlist
-        if len(items) < 50:
-            return None
-        offset += 50
+        return None
+
+    # Recently created playlists usually sit on the first page, so only fan out when it has no match.
+    fetch_page = partial(fetch_user_playlists_page, sp)
+    first_page = fetch_page(0)
+    return first_match(first_page.get("items", [])) or first_match(
+        fetch_remaining_pages(fetch_page, first_page, 50, concurrency)
+    )
+
 
+def get_playlist_track_uris(sp: spotipy.Spotify, playlist_id: str, concurrency: int) -> list[str]:
+    def fetch_page(offset: int) -> dict:
+        return sp.playlist_items(
+            playlist_id,
+            fields="items(track(uri),item(uri)),total",
+            limit=100,
+            offset=offset,
+            additional_types=("track",),
+        )
 
-def get_playlist_track_uris(sp: spotipy.Spotify, playlist_id: str) -> list[str]:
     uris: list[str] = []
-    results = sp.playlist_tracks(playlist_id, fields="items.track.uri,next")
-    while results:
-        for item in results.get("items", []):
-            track = item.get("track")
-            if track and track.get("uri"):
-                uris.append(track["uri"])
-        if results.get("next"):
-            results = sp.next(results)
-        else:
-            break
+    for item in fetch_all_pages(fetch_page, 100, concurrency):
+        # The /items endpoint renames "track" to "item" (see SPOTIFY_API_CHANGES.md); accept both.
+        track = item.get("item") or item.get("track")
+        if track and track.get("uri"):
+            uris.append(track["uri"])
     return uris
 
 
-def replace_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, uris: list[str], chunk_size: int):
-    sp.playlist_replace_items(playlist_id, uris[:100])
+def same_tracks(existing_uris: list[str], new_uris: list[str], ignore_order: bool) -> bool:
+    # Order is part of the playlist unless tracks are shuffled, in which case a re-run
+    # should not replace the playlist just because the new shuffle came out differently.
+    if len(existing_uris) != len(new_uris):
+        return False
+    if ignore_order:
+        return frozenset(existing_uris) == frozenset(new_uris)
+    return existing_uris == new_uris
+
+
+def track_uris_digest(uris: list[str], ignore_order: bool) -> str:
+    # Stable across runs (unlike hash()); the mode prefix keeps ordered and unordered digests apart.
+    mode, ordered_uris = ("unordered", sorted(uris)) if ignore_order else ("ordered", uris)
+    return hashlib.sha256("\n".join([mode, *ordered_uris]).encode("utf-8")).hexdigest()
+
+
+def replace_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, uris: list[str], chunk_size: int) -> str | None:
+    snapshot_id = sp.playlist_replace_items(playlist_id, uris[:100]).get("snapshot_id")
     for i in range(100, len(uris), chunk_size):
-        sp.playlist_add_items(playlist_id, uris[i : i + chunk_size])
+        snapshot_id = sp.playlist_add_items(playlist_id, uris[i : i + chunk_size]).get("snapshot_id")
+    return snapshot_id
 
 
-def add_tracks_in_chunks(sp: spotipy.Spotify, playlist_id: str, uris: list[str], chunk_size: int):
+def add_tracks_in_chunks(sp: spotipy.Spotify, playlist_id: str, uris: list[str], chunk_size: int) -> str | None:
+    snapshot_id = None
     for i in range(0, len(uris), chunk_size):
-        sp.playlist_add_items(playlist_id, uris[i : i + chunk_size])
+        snapshot_id = sp.playlist_add_items(playlist_id, uris[i : i + chunk_size]).get("snapshot_id")
+    return snapshot_id
 
 
 def upload_cover_image(sp: spotipy.Spotify, playlist_id: str, cover_image: Path):
@@ -321,6 +482,7 @@ def main():
     track_limit = int_env("TOP_TRACKS_PER_ARTIST", "5")
     search_limit = int_env("SPOTIFY_SEARCH_LIMIT", "5")
     chunk_size = int_env("SPOTIFY_ADD_CHUNK_SIZE", "100")
+    concurrency = int_env("SPOTIFY_CONCURRENCY", "8")
     cover_image_env = env_or_default("PLAYLIST_COVER_IMAGE", "")
     cover_image = resolve_path(cover_image_env) if cover_image_env else None
     scopes_raw = env_or_default("SPOTIFY_SCOPES", "playlist-modify-private playlist-modify-public")
@@ -328,6 +490,8 @@ def main():
         scopes_raw += " ugc-image-upload"
     scopes = parse_scopes(scopes_raw)
     token_cache_path = resolve_path(env_or_default("SPOTIFY_TOKEN_CACHE_PATH", ".spotify_cache"))
+    api_cache_path = resolve_path(env_or_default("SPOTIFY_API_CACHE_PATH", ".spotify_api_cache.sqlite"))
+    api_cache_ttl_days = int_env("SPOTIFY_API_CACHE_TTL_DAYS", "7")
     shuffle_tracks = bool_env("SHUFFLE_TRACKS", "false")
     dry_run = bool_env("DRY_RUN", "false")
     force_recreate = bool_env("FORCE_RECREATE", "false")
@@ -342,10 +506,22 @@ def main():
         raise SystemExit("SPOTIFY_SEARCH_LIMIT must be > 0")
     if chunk_size <= 0:
         raise SystemExit("SPOTIFY_ADD_CHUNK_SIZE must be > 0")
+    if concurrency <= 0:
+        raise SystemExit("SPOTIFY_CONCURRENCY must be > 0")
     if cover_image and not cover_image.exists():
         raise SystemExit(f"Cover image not found: {cover_image}")
 
-    playlist_name = derive_playlist_name(bands_file)
+    # Read the band list once; all helpers work on these lines.
+    lines = read_lines(bands_file)
+    document = parse_bands_document(lines, not_found_hint, skipped_hint)
+    bands = document.bands
+    playlist_name = derive_playlist_name(document.title, bands_file.stem)
+
+    # Dry runs only read an existing cache; with FORCE_RECREATE they bypass it, as a real run would clear it.
+    use_cache = api_cache_ttl_days > 0 and not (dry_run and (force_recreate or not api_cache_path.exists()))
+    cache = ApiCache(api_cache_path, api_cache_ttl_days * 86400, read_only=dry_run) if use_cache else None
+    if cache and force_recreate:
+        cache.clear()
 
     auth = SpotifyPKCE(
         client_id=client_id,
@@ -355,47 +531,70 @@ def main():
         cache_path=str(token_cache_path),
     )
 
-    sp = spotipy.Spotify(auth_manager=auth)
+    sp = spotipy.Spotify(auth_manager=auth, requests_session=build_http_session(concurrency))
     user_id = sp.current_user()["id"]
 
-    bands, intentionally_skipped_bands, track_overrides = load_bands(bands_file, not_found_hint, skipped_hint)
+    # Bands linked to an artist by a previous run skip the search and are looked up
+    # in batches instead; IDs that no longer resolve fall back to a regular search.
+    known_ids_to_fetch = [
+        artist_id for band, artist_id in document.artist_ids.items() if band not in document.skipped
+    ]
+    known_artists = fetch_artists_by_id(sp, list(dict.fromkeys(known_ids_to_fetch)))
 
-    all_track_uris: list[str] = []
+    deduped_track_uris: list[str] = []
+    seen_track_uris: set[str] = set()
     unresolved: list[str] = []
     not_found_exact: set[str] = set()
     intentionally_skipped: set[str] = set()
     artist_urls: dict[str, str] = {}
 
-    for i, band in enumerate(bands, start=1):
-        query = normalize_artist_query(band, intentionally_skipped_bands)
-        if not query:
-            print(f"  [{i}/{len(bands)}] {band} — skipped")
-            intentionally_skipped.add(band)
-            unresolved.append(band)
-            continue
-
-        artist = pick_best_artist(sp, query, market, search_limit)
-        if not artist:
-            print(f"  [{i}/{len(bands)}] {band} — not found")
-            not_found_exact.add(band)
-            unresolved.append(band)
-            continue
-
-        url = artist.get("external_urls", {}).get("spotify", "")
-        if url:
-            artist_urls[band] = url
-
-        band_track_limit = track_overrides.get(band, track_limit)
-        artist_tracks = top_tracks_for_artist(sp, artist["id"], market=market, track_limit=band_track_limit)
-        if not artist_tracks:
-            print(f"  [{i}/{len(bands)}] {band} — no tracks")
-            unresolved.append(band)
-            continue
-
-        print(f"  [{i}/{len(bands)}] {band} ✓ {len(artist_tracks)} tracks")
-        all_track_uris.extend(artist_tracks)
-
-    deduped_track_uris = list(dict.fromkeys(all_track_uris))
+    # Search + top tracks are independent per band, so run them on a bounded pool
+    # and consume the results in file order to keep the progress output stable.
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = []
+        for band in bands:
+            query = normalize_artist_query(band, document.skipped)
+            known_artist = known_artists.get(document.artist_ids.get(band, ""))
+            band_track_limit = document.track_overrides.get(band, track_limit)
+            futures.append(
+                pool.submit(resolve_band, sp, cache, query, known_artist, market, search_limit, band_track_limit)
+                if query
+                else None
+            )
+
+        for i, (band, future) in enumerate(zip(bands, futures), start=1):
+            if future is None:
+                print(f"  [{i}/{len(bands)}] {band} — skipped")
+                intentionally_skipped.add(band)
+                unresolved.append(band)
+                continue
+
+            try:
+                artist, artist_tracks = future.result()
+            except BaseException:
+                # Don't keep querying a failing (e.g. rate-limited) API for bands still queued.
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            if not artist:
+                print(f"  [{i}/{len(bands)}] {band} — not found")
+                not_found_exact.add(band)
+                unresolved.append(band)
+                continue
+
+            url = artist.get("external_urls", {}).get("spotify", "")
+            if url:
+                artist_urls[band] = url
+
+            if not artist_tracks:
+                print(f"  [{i}/{len(bands)}] {band} — no tracks")
+                unresolved.append(band)
+                continue
+
+            print(f"  [{i}/{len(bands)}] {band} ✓ {len(artist_tracks)} tracks")
+            for uri in artist_tracks:
+                if uri not in seen_track_uris:
+                    seen_track_uris.add(uri)
+                    deduped_track_uris.append(uri)
 
     if shuffle_tracks:
         random.shuffle(deduped_track_uris)
@@ -419,22 +618,37 @@ def main():
                     print(f"  - {name} (no exact match)")
         return
 
-    update_bands_hints(bands_file, not_found_exact, intentionally_skipped, not_found_hint, skipped_hint, artist_urls)
+    # Persist hints and artist links before any playlist call, so they survive a failing write endpoint.
+    lines = update_bands_hints(lines, not_found_exact, intentionally_skipped, not_found_hint, skipped_hint, artist_urls)
+    write_lines(bands_file, lines)
 
     if not deduped_track_uris:
         raise SystemExit("No tracks found. Playlist was not created.")
 
-    existing = find_existing_playlist(sp, user_id, playlist_name)
+    existing = find_existing_playlist(sp, user_id, playlist_name, concurrency)
+
+    tracks_digest = track_uris_digest(deduped_track_uris, ignore_order=shuffle_tracks)
 
     if existing and not force_recreate:
-        existing_uris = get_playlist_track_uris(sp, existing["id"])
         playlist_id = existing["id"]
         playlist_url = f"https://open.spotify.com/playlist/{playlist_id}"
 
-        if set(existing_uris) == set(deduped_track_uris):
+        # If Spotify still reports the snapshot we last wrote (or verified) for these exact
+        # tracks, the playlist is untouched and its tracks don't need to be downloaded.
+        snapshot_id = existing.get("snapshot_id")
+        unchanged = bool(cache and snapshot_id) and (
+            cache.get_playlist_state(playlist_id) == (snapshot_id, tracks_digest)
+        )
+        if not unchanged:
+            existing_uris = get_playlist_track_uris(sp, playlist_id, concurrency)
+            unchanged = same_tracks(existing_uris, deduped_track_uris, ignore_order=shuffle_tracks)
+            if unchanged and cache and snapshot_id:
+                cache.set_playlist_state(playlist_id, snapshot_id, tracks_digest)
+
+        if unchanged:
             if cover_image:
                 upload_cover_image(sp, playlist_id, cover_image)
-            append_playlist_url(bands_file, playlist_url)
+            write_lines(bands_file, append_playlist_url(lines, playlist_url))
             matched_count = len(bands) - len(unresolved)
             print(f"\nPlaylist unchanged: {playlist_name}")
             print(f"URL: {playlist_url}")
@@ -446,10 +660,12 @@ def main():
             return
 
         # Tracks changed — update in-place
-        replace_playlist_tracks(sp, playlist_id, deduped_track_uris, chunk_size)
+        snapshot_id = replace_playlist_tracks(sp, playlist_id, deduped_track_uris, chunk_size)
+        if cache and snapshot_id:
+            cache.set_playlist_state(playlist_id, snapshot_id, tracks_digest)
         if cover_image:
             upload_cover_image(sp, playlist_id, cover_image)
-        append_playlist_url(bands_file, playlist_url)
+        write_lines(bands_file, append_playlist_url(lines, playlist_url))
         matched_count = len(bands) - len(unresolved)
         print(f"\nUpdated playlist: {playlist_name}")
         print(f"URL: {playlist_url}")
@@ -461,20 +677,22 @@ def main():
         return
 
     if existing and force_recreate:
-        deleted_count = delete_existing_playlists(sp, user_id, playlist_name)
+        deleted_count = delete_existing_playlists(sp, user_id, playlist_name, concurrency)
         if deleted_count:
             print(f"Force recreate: removed {deleted_count} existing playlist(s)")
 
     print("Creating playlist as: public")
 
     playlist_id = create_playlist(sp, user_id, playlist_name, playlist_description)
-    add_tracks_in_chunks(sp, playlist_id, deduped_track_uris, chunk_size)
+    snapshot_id = add_tracks_in_chunks(sp, playlist_id, deduped_track_uris, chunk_size)
+    if cache and snapshot_id:
+        cache.set_playlist_state(playlist_id, snapshot_id, tracks_digest)
 
     if cover_image:
         upload_cover_image(sp, playlist_id, cover_image)
 
     playlist_url = f"https://open.spotify.com/playlist/{playlist_id}"
-    append_playlist_url(bands_file, playlist_url)
+    write_lines(bands_file, append_playlist_url(lines, playlist_url))
     matched_count = len(bands) - len(unresolved)
     print(f"\nCreated playlist: {playlist_name}")
     print(f"URL: {playlist_url}")